@@ -1,48 +1,764 @@
 import os
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from mcstatus import JavaServer
 from mcstatus import BedrockServer
+import aiohttp
 import asyncio
+import base64
+import hashlib
 import logging
+import pickle
+import socket
+import sqlite3
+import tempfile
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
 from fastapi.middleware.cors import CORSMiddleware
+import json
 import time
-from typing import Dict, Tuple, List
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Literal, NamedTuple, Tuple, List
 
 load_dotenv()
 
-_roblox_status_cache: Dict[str, Tuple[float, dict]] = {}
-_roblox_universe_cache: Dict[str, Tuple[float, dict]] = {}
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 10000))
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 16 * 1024 * 1024))
+CACHE_SWEEP_INTERVAL_SECONDS = int(os.environ.get("CACHE_SWEEP_INTERVAL", 60))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", 10000))
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+
+SHARED_CACHE_PATH = os.environ.get("SHARED_CACHE_PATH", "")
+SHARED_CACHE_LEASE_SECONDS = int(os.environ.get("SHARED_CACHE_LEASE", 15))
+SHARED_CACHE_POLL_INTERVAL_SECONDS = 0.05
+SHARED_CACHE_BUSY_TIMEOUT_MS = int(os.environ.get("SHARED_CACHE_BUSY_TIMEOUT_MS", 5))
+SHARED_CACHE_TRIM_EVERY = 100
+SHARED_CACHE_RELEASE_ATTEMPTS = 5
+
+CACHE_SNAPSHOT_PATH = os.environ.get("CACHE_SNAPSHOT_PATH", "")
+CACHE_SNAPSHOT_INTERVAL_SECONDS = int(os.environ.get("CACHE_SNAPSHOT_INTERVAL", 0))
+
+REFRESH_INTERVAL_SECONDS = int(os.environ.get("REFRESH_INTERVAL", 5))
+REFRESH_HOT_WINDOW_SECONDS = int(os.environ.get("REFRESH_HOT_WINDOW", 60))
+REFRESH_HOT_HITS = int(os.environ.get("REFRESH_HOT_HITS", 3))
+REFRESH_AHEAD_FRACTION = float(os.environ.get("REFRESH_AHEAD_FRACTION", 0.5))
+REFRESH_WATCHLIST = [item.strip() for item in os.environ.get("REFRESH_WATCHLIST", "").split(",") if item.strip()]
+
+FAILURE_TIMEOUT = "timeout"
+FAILURE_UPSTREAM = "upstream_5xx"
+FAILURE_PARSE = "parse_error"
+FAILURE_OFFLINE = "offline"
+
+NEGATIVE_CACHE_TTL_SECONDS = {
+    FAILURE_TIMEOUT: int(os.environ.get("NEGATIVE_CACHE_TTL_TIMEOUT", 15)),
+    FAILURE_UPSTREAM: int(os.environ.get("NEGATIVE_CACHE_TTL_UPSTREAM", 30)),
+    FAILURE_PARSE: int(os.environ.get("NEGATIVE_CACHE_TTL_PARSE", 60)),
+    FAILURE_OFFLINE: int(os.environ.get("NEGATIVE_CACHE_TTL_OFFLINE", 60)),
+}
+NEGATIVE_CACHE_MAX_TTL_SECONDS = int(os.environ.get("NEGATIVE_CACHE_MAX_TTL", 300))
+
+class CachedFailure(Exception):
+    """Raised by a cache fetch to store result as a classified failure with a short, backed-off TTL."""
+
+    def __init__(self, kind: str, result: dict):
+        super().__init__(kind)
+        self.kind = kind
+        self.result = result
+
+def _classify_failure(e: Exception) -> str:
+    if isinstance(e, (asyncio.TimeoutError, TimeoutError)):
+        return FAILURE_TIMEOUT
+    # ContentTypeError subclasses ClientResponseError, so it has to be checked first.
+    if isinstance(e, (ValueError, KeyError, TypeError, aiohttp.ContentTypeError)):
+        return FAILURE_PARSE
+    if isinstance(e, aiohttp.ClientResponseError):
+        return FAILURE_UPSTREAM if e.status >= 500 or e.status == 429 else FAILURE_OFFLINE
+    if isinstance(e, OSError):
+        return FAILURE_OFFLINE
+    return FAILURE_UPSTREAM
+
+class CacheEntry(NamedTuple):
+    expires_at: float
+    size: int
+    value: Any
+    failures: int
+
+class TTLCache:
+    """In-memory TTL cache with LRU eviction, bounded by entry count and approximate size in bytes.
+
+    Misses go through a per-key single-flight so concurrent callers share one upstream fetch.
+    Entries older than their TTL but still inside stale_ttl are served as-is while a single
+    background task refreshes them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: int,
+        stale_ttl: int = 0,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, "asyncio.Task[dict]"] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._hits: Dict[str, int] = {}
+        self._hot: set = set()
+        self._fetchers: Dict[str, Callable[[], Awaitable[dict]]] = {}
+        _caches.append(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._lookup(key)
+        if entry is None or entry.expires_at <= time.time():
+            return None
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, failures: int = 0) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        if self._store(key, expires_at, value, failures):
+            store = _get_shared_store()
+            if store is not None:
+                store.set(self.name, key, expires_at, failures, value, self.max_entries, self.max_bytes)
+
+    def _store(self, key: str, expires_at: float, value: Any, failures: int) -> bool:
+        if key in self._entries:
+            self._remove(key)
+        size = _estimate_size(key, value)
+        if size > self.max_bytes:
+            return False
+        self._entries[key] = CacheEntry(expires_at, size, value, failures)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+        return True
+
+    def set_failure(self, key: str, failure: CachedFailure) -> None:
+        """Store a failed result; each consecutive failure for key doubles its TTL up to the cap.
+
+        The first failure is never cached longer than the cache's own TTL, so a host that was only
+        briefly down recovers as fast as a success would refresh; backoff only grows for hosts that stay down.
+        """
+        previous = self._entries.get(key)
+        failures = previous.failures + 1 if previous is not None else 1
+        ttl = NEGATIVE_CACHE_TTL_SECONDS.get(failure.kind, NEGATIVE_CACHE_TTL_SECONDS[FAILURE_UPSTREAM])
+        ttl = min(min(ttl, self.ttl) * 2 ** (failures - 1), NEGATIVE_CACHE_MAX_TTL_SECONDS)
+        self.set(key, failure.result, ttl=ttl, failures=failures)
+
+    def _keep_stale(self, key: str, failure: CachedFailure) -> Optional[Any]:
+        """On a failed refresh, keep serving a good entry still inside its stale window (stale-if-error).
+
+        Returns the stale value and holds off the next refresh for the failure's negative TTL, or None
+        when there is no such entry and the failure should be cached instead.
+        """
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is None or entry.failures or entry.expires_at + self.stale_ttl <= now:
+            return None
+        retry = NEGATIVE_CACHE_TTL_SECONDS.get(failure.kind, NEGATIVE_CACHE_TTL_SECONDS[FAILURE_UPSTREAM])
+        self._retry_at[key] = now + retry
+        return entry.value
+
+    def _refresh_allowed(self, key: str, now: float) -> bool:
+        return key not in self._inflight and self._retry_at.get(key, 0) <= now
+
+    def version(self, key: str, value: Any) -> Optional[float]:
+        """A token that changes whenever key is stored again, or None if value is not what key holds now."""
+        entry = self._entries.get(key)
+        if entry is None or entry.value is not value:
+            return None
+        return entry.expires_at
+
+    def remaining_ttl(self, key: str) -> int:
+        """Whole seconds until key expires, 0 when it is missing or already being served stale."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return 0
+        return max(int(entry.expires_at - time.time()), 0)
+
+    def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+        store = _get_shared_store()
+        if store is not None:
+            store.delete(self.name, key)
+
+    def sweep(self) -> int:
+        """Drop every entry past its stale window and return how many were removed."""
+        now = time.time()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at + self._retention(entry) <= now]
+        for key in expired:
+            self._remove(key)
+        return len(expired)
+
+    def snapshot(self) -> List[Tuple[str, float, Any, int]]:
+        """Return (key, expires_at, value, failures) for every entry, least recently used first."""
+        return [(key, entry.expires_at, entry.value, entry.failures) for key, entry in self._entries.items()]
+
+    def restore(self, entries: List[Tuple[str, float, Any, int]]) -> int:
+        """Load entries from snapshot(), skipping any already past their stale window, and return how many were kept."""
+        now = time.time()
+        restored = 0
+        for key, expires_at, value, failures in entries:
+            if expires_at + self._retention(CacheEntry(expires_at, 0, value, failures)) <= now:
+                continue
+            if self._store(key, expires_at, value, failures):
+                restored += 1
+        return restored
+
+    def roll_hot_keys(self, min_hits: int) -> None:
+        """Make the keys requested at least min_hits times since the last roll the new hot set."""
+        self._hot = {key for key, hits in self._hits.items() if hits >= min_hits}
+        self._hits = {}
+        self._fetchers = {key: fetch for key, fetch in self._fetchers.items() if key in self._hot}
+
+    def due_for_refresh(self, horizon: float, min_hits: int) -> List[str]:
+        """Return the hot keys that should be refreshed before horizon.
+
+        Each key refreshes at its own point in the last REFRESH_AHEAD_FRACTION of its TTL, derived from
+        a hash of the key, so keys cached together do not all come due on the same tick.
+        """
+        hot = self._hot | {key for key, hits in self._hits.items() if hits >= min_hits}
+        due = []
+        for key in hot:
+            if key not in self._fetchers or not self._refresh_allowed(key, time.time()):
+                continue
+            entry = self._load_shared(key, self._entries.get(key))
+            if entry is None:
+                due.append(key)
+                continue
+            lead = 0.0 if entry.failures else self.ttl * REFRESH_AHEAD_FRACTION * _spread(f"{self.name}|{key}")
+            if entry.expires_at - lead <= horizon:
+                due.append(key)
+        return due
+
+    async def refresh(self, key: str) -> None:
+        """Re-fetch key with the fetch its last caller used."""
+        fetch = self._fetchers.get(key)
+        if fetch is not None:
+            await self._start_fetch(key, fetch)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+        # Hit tracking is capped at max_entries keys per window so random-key traffic cannot grow it unbounded.
+        if key in self._hits or len(self._hits) < self.max_entries:
+            self._hits[key] = self._hits.get(key, 0) + 1
+            self._fetchers[key] = fetch
+        elif key in self._hot:
+            self._fetchers[key] = fetch
+        entry = self._lookup(key)
+        if entry is not None:
+            now = time.time()
+            if entry.expires_at <= now and self._refresh_allowed(key, now):
+                refresh = self._start_fetch(key, fetch)
+                refresh.add_done_callback(self._log_refresh_failure)
+            return entry.value
+
+        return await asyncio.shield(self._start_fetch(key, fetch))
+
+    def _start_fetch(self, key: str, fetch: Callable[[], Awaitable[dict]]) -> "asyncio.Task[dict]":
+        async def fetch_and_store() -> dict:
+            # Across workers the lease plays the part of the in-process single-flight: whoever holds it
+            # fetches and the rest wait for its result to land in the shared store.
+            store = _get_shared_store()
+            leased = store is None or store.acquire_lease(self.name, key, SHARED_CACHE_LEASE_SECONDS)
+            if not leased:
+                entry = await self._wait_for_peer(store, key)
+                if entry is not None:
+                    return entry.value
+            try:
+                try:
+                    result = await fetch()
+                except CachedFailure as failure:
+                    stale = self._keep_stale(key, failure)
+                    if stale is not None:
+                        return stale
+                    self.set_failure(key, failure)
+                    return failure.result
+                self.set(key, result)
+                return result
+            finally:
+                if store is not None and leased:
+                    await self._release_lease(store, key)
+
+        return _start_flight(self._inflight, key, fetch_and_store)
+
+    async def _wait_for_peer(self, store: "SharedCacheStore", key: str) -> Optional[CacheEntry]:
+        """Wait for the worker holding the lease on key to store a newer entry and return it.
+
+        The shared entry is checked on every poll, so waiters return as soon as the result lands even if
+        the lease release itself was lost. Returns None if the lease ends without a fresh entry.
+        """
+        previous = self._load_shared(key, self._entries.get(key))
+        baseline = previous.expires_at if previous is not None else 0.0
+        while True:
+            entry = self._load_shared(key, self._entries.get(key))
+            if entry is not None and entry.expires_at > baseline and entry.expires_at > time.time():
+                return entry
+            if not store.lease_active(self.name, key):
+                return None
+            await asyncio.sleep(SHARED_CACHE_POLL_INTERVAL_SECONDS)
+
+    async def _release_lease(self, store: "SharedCacheStore", key: str) -> None:
+        # A release lost to a busy database would leave peers waiting for the lease to expire, so retry it.
+        for _ in range(SHARED_CACHE_RELEASE_ATTEMPTS):
+            if store.release_lease(self.name, key):
+                return
+            await asyncio.sleep(SHARED_CACHE_POLL_INTERVAL_SECONDS)
+        logging.warning(
+            f"Failed to release the shared {self.name} cache lease on {key}; it expires in {SHARED_CACHE_LEASE_SECONDS}s"
+        )
+
+    def _load_shared(
+        self, key: str, entry: Optional[CacheEntry]
+    ) -> Optional[CacheEntry]:
+        """Replace entry with the shared store's copy of key when that one is newer."""
+        store = _get_shared_store()
+        if store is None:
+            return entry
+        shared = store.get(self.name, key)
+        if shared is None:
+            return entry
+        expires_at, failures, value = shared
+        if entry is not None and expires_at <= entry.expires_at:
+            return entry
+        self._store(key, expires_at, value, failures)
+        return self._entries.get(key)
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        now = time.time()
+        if entry is None or entry.expires_at <= now:
+            entry = self._load_shared(key, entry)
+        if entry is None:
+            return None
+        if entry.expires_at + self._retention(entry) <= now:
+            self._remove(key)
+            return None
+        if entry.expires_at + self.stale_ttl <= now:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _retention(self, entry: CacheEntry) -> int:
+        # Failed entries outlive their stale window so the next failure still sees the backoff count.
+        if entry.failures:
+            return max(self.stale_ttl, NEGATIVE_CACHE_MAX_TTL_SECONDS)
+        return self.stale_ttl
+
+    def _remove(self, key: str) -> None:
+        size = self._entries.pop(key).size
+        self._bytes -= size
+        self._retry_at.pop(key, None)
+
+    def _log_refresh_failure(self, task: "asyncio.Task[dict]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logging.warning(f"Background refresh of {self.name} cache failed - {str(task.exception())}")
+
+_caches: List[TTLCache] = []
+
+class SharedCacheStore:
+    """Cache entries shared by every worker process on the host, kept in a SQLite database in WAL mode.
+
+    Values are pickled, so the database file must only be writable by this service: it is created
+    with mode 0600 and refused if another user owns it or can write to it or its directory. Queries
+    run on the event loop with a busy timeout of a few milliseconds; a busy or broken database is
+    treated as a miss so contention degrades to per-process caching instead of stalling the worker.
+    """
+
+    def __init__(self, path: str):
+        _check_private_path(os.path.dirname(os.path.abspath(path)))
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        _check_private_path(path)
+        self._db = sqlite3.connect(path, timeout=1, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries (cache TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL NOT NULL,"
+            " failures INTEGER NOT NULL, value BLOB NOT NULL, PRIMARY KEY (cache, key))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS leases (cache TEXT NOT NULL, key TEXT NOT NULL, expires_at REAL NOT NULL,"
+            " PRIMARY KEY (cache, key))"
+        )
+        self._db.execute(f"PRAGMA busy_timeout = {SHARED_CACHE_BUSY_TIMEOUT_MS}")
+        self._writes: Dict[str, int] = {}
+
+    def get(self, cache: str, key: str) -> Optional[Tuple[float, int, Any]]:
+        cursor = self._execute(
+            "SELECT expires_at, failures, value FROM entries WHERE cache = ? AND key = ?", (cache, key)
+        )
+        row = cursor.fetchone() if cursor is not None else None
+        if row is None:
+            return None
+        try:
+            return row[0], row[1], pickle.loads(row[2])
+        except Exception as e:
+            logging.warning(f"Dropping unreadable shared {cache} cache entry - {str(e)}")
+            self.delete(cache, key)
+            return None
+
+    def set(
+        self, cache: str, key: str, expires_at: float, failures: int, value: Any, max_entries: int, max_bytes: int
+    ) -> None:
+        """Store an entry, trimming cache back to its limits every SHARED_CACHE_TRIM_EVERY writes."""
+        self._execute(
+            "INSERT OR REPLACE INTO entries (cache, key, expires_at, failures, value) VALUES (?, ?, ?, ?, ?)",
+            (cache, key, expires_at, failures, pickle.dumps(value)),
+        )
+        self._writes[cache] = self._writes.get(cache, 0) + 1
+        if self._writes[cache] >= SHARED_CACHE_TRIM_EVERY:
+            self._writes[cache] = 0
+            self.trim(cache, max_entries, max_bytes)
+
+    def delete(self, cache: str, key: str) -> None:
+        self._execute("DELETE FROM entries WHERE cache = ? AND key = ?", (cache, key))
+
+    def acquire_lease(self, cache: str, key: str, seconds: int) -> bool:
+        """Take the fetch lease on key unless another worker holds an unexpired one."""
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO leases (cache, key, expires_at) VALUES (?, ?, ?)"
+            " ON CONFLICT (cache, key) DO UPDATE SET expires_at = excluded.expires_at WHERE leases.expires_at <= ?",
+            (cache, key, now + seconds, now),
+        )
+        # If the store is unavailable, fetch anyway rather than wait on a lease nobody can release.
+        return cursor is None or cursor.rowcount == 1
+
+    def release_lease(self, cache: str, key: str) -> bool:
+        """Drop the fetch lease on key; False if the database was busy and the lease is still held."""
+        return self._execute("DELETE FROM leases WHERE cache = ? AND key = ?", (cache, key)) is not None
+
+    def lease_active(self, cache: str, key: str) -> bool:
+        cursor = self._execute(
+            "SELECT 1 FROM leases WHERE cache = ? AND key = ? AND expires_at > ?", (cache, key, time.time())
+        )
+        return cursor is not None and cursor.fetchone() is not None
+
+    def sweep(self, cache: str, retention: int, max_entries: int, max_bytes: int) -> int:
+        """Drop entries of cache past retention, then trim it to its limits; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        cursor = self._execute("DELETE FROM entries WHERE cache = ? AND expires_at <= ?", (cache, now - retention))
+        if cursor is not None:
+            removed += cursor.rowcount
+        removed += self.trim(cache, max_entries, max_bytes)
+        self._execute("DELETE FROM leases WHERE cache = ? AND expires_at <= ?", (cache, now))
+        return removed
+
+    def trim(self, cache: str, max_entries: int, max_bytes: int) -> int:
+        """Keep the latest-expiring entries of cache that fit in max_entries and max_bytes."""
+        cursor = self._execute(
+            "DELETE FROM entries WHERE cache = ? AND key IN (SELECT key FROM ("
+            " SELECT key, ROW_NUMBER() OVER w AS position, SUM(length(key) + length(value)) OVER w AS total"
+            " FROM entries WHERE cache = ? WINDOW w AS (ORDER BY expires_at DESC ROWS UNBOUNDED PRECEDING)"
+            ") WHERE position > ? OR total > ?)",
+            (cache, cache, max_entries, max_bytes),
+        )
+        return cursor.rowcount if cursor is not None else 0
+
+    def _execute(self, sql: str, params: tuple) -> Optional[sqlite3.Cursor]:
+        try:
+            return self._db.execute(sql, params)
+        except sqlite3.Error as e:
+            # Busy under write contention from another worker is routine; the caller treats it as a miss.
+            if isinstance(e, sqlite3.OperationalError) and "locked" in str(e):
+                logging.debug(f"Shared cache query skipped - {str(e)}")
+            else:
+                logging.warning(f"Shared cache query failed - {str(e)}")
+            return None
+
+def _check_private_path(path: str) -> None:
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise PermissionError(f"{path} must be owned by this user and not writable by others")
+
+_shared_store: Optional[SharedCacheStore] = None
+_shared_store_pid: Optional[int] = None
+
+def _get_shared_store() -> Optional[SharedCacheStore]:
+    """Return this process's connection to the shared cache, or None when SHARED_CACHE_PATH is unset.
+
+    The connection is opened per process so workers forked after import never share one.
+    """
+    global _shared_store, _shared_store_pid
+    if not SHARED_CACHE_PATH:
+        return None
+    if _shared_store_pid != os.getpid():
+        _shared_store_pid = os.getpid()
+        try:
+            _shared_store = SharedCacheStore(SHARED_CACHE_PATH)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Shared cache disabled, caching per process - {str(e)}")
+            _shared_store = None
+    return _shared_store
+
+def _estimate_size(key: str, value: Any) -> int:
+    if isinstance(value, bytes):
+        return len(key) + len(value)
+    return len(key) + len(json.dumps(value, default=str))
+
+def _spread(key: str) -> float:
+    return int.from_bytes(hashlib.sha1(key.encode()).digest()[:4], "big") / 2 ** 32
+
+def _start_flight(
+    inflight: Dict[str, "asyncio.Task[dict]"],
+    key: str,
+    fetch: Callable[[], Awaitable[dict]],
+) -> "asyncio.Task[dict]":
+    """Start fetch() unless one is already running for key, and return the shared task.
+
+    The fetch runs as its own task so a caller disconnecting does not cancel it for the others.
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    return task
+
+HTTP_POOL_LIMIT = int(os.environ.get("HTTP_POOL_LIMIT", 100))
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", 20))
+HTTP_DNS_CACHE_TTL_SECONDS = int(os.environ.get("HTTP_DNS_CACHE_TTL", 300))
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = int(os.environ.get("HTTP_KEEPALIVE_TIMEOUT", 30))
+HTTP_TIMEOUT_SECONDS = int(os.environ.get("HTTP_TIMEOUT", 10))
+HTTP_PROBE_POOL_LIMIT = int(os.environ.get("HTTP_PROBE_POOL_LIMIT", 64))
+
+_http_session: Optional[aiohttp.ClientSession] = None
+_probe_http_session: Optional[aiohttp.ClientSession] = None
+
+def _create_http_session(limit: int = HTTP_POOL_LIMIT) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS))
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the app-wide pooled session, creating it if the lifespan has not (e.g. when called outside the app)."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = _create_http_session()
+    return _http_session
+
+def _get_probe_http_session() -> aiohttp.ClientSession:
+    """Return the session for user-supplied hosts (Hytale Nitrado).
+
+    It has its own connection pool, so dead hosts holding connections until they time out can never
+    starve the Roblox, Steam and Epic requests on the app-wide session.
+    """
+    global _probe_http_session
+    if _probe_http_session is None or _probe_http_session.closed:
+        _probe_http_session = _create_http_session(HTTP_PROBE_POOL_LIMIT)
+    return _probe_http_session
+
+async def _sweep_caches() -> None:
+    while True:
+        await asyncio.sleep(CACHE_SWEEP_INTERVAL_SECONDS)
+        for cache in _caches:
+            removed = cache.sweep()
+            store = _get_shared_store()
+            if store is not None:
+                retention = max(cache.stale_ttl, NEGATIVE_CACHE_MAX_TTL_SECONDS)
+                removed += store.sweep(cache.name, retention, cache.max_entries, cache.max_bytes)
+            if removed:
+                logging.debug(f"Swept {removed} expired entries from {cache.name} cache")
+
+def _load_cache_snapshot() -> None:
+    if not CACHE_SNAPSHOT_PATH or not os.path.exists(CACHE_SNAPSHOT_PATH):
+        return
+    try:
+        # The snapshot is unpickled, so refuse it if anyone but this user could have written it.
+        _check_private_path(os.path.dirname(os.path.abspath(CACHE_SNAPSHOT_PATH)))
+        _check_private_path(CACHE_SNAPSHOT_PATH)
+        with open(CACHE_SNAPSHOT_PATH, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        logging.warning(f"Failed to load cache snapshot - {str(e)}")
+        return
+    restored = sum(cache.restore(snapshot.get(cache.name, [])) for cache in _caches)
+    logging.info(f"Restored {restored} cache entries from {CACHE_SNAPSHOT_PATH}")
 
-_roblox_status_lock = asyncio.Lock()
-_roblox_universe_lock = asyncio.Lock()
+async def _save_cache_snapshot() -> None:
+    """Write every cache to CACHE_SNAPSHOT_PATH so the next process starts warm.
+
+    Entries are copied on the event loop and pickled in a thread; the file is replaced atomically.
+    """
+    if not CACHE_SNAPSHOT_PATH:
+        return
+    snapshot = {cache.name: cache.snapshot() for cache in _caches}
+
+    def write() -> None:
+        # mkstemp creates an unpredictable name with mode 0600 in the snapshot's own directory.
+        directory = os.path.dirname(os.path.abspath(CACHE_SNAPSHOT_PATH))
+        fd, temp_path = tempfile.mkstemp(prefix=".cache-snapshot-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, CACHE_SNAPSHOT_PATH)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    try:
+        await asyncio.to_thread(write)
+    except Exception as e:
+        logging.warning(f"Failed to save cache snapshot - {str(e)}")
+
+_refresh_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+async def _refresh_hot_keys() -> None:
+    """Refresh hot keys across every cache shortly before they expire."""
+    horizon = time.time() + REFRESH_INTERVAL_SECONDS
+    refreshes = [
+        _refresh_key(cache, key)
+        for cache in _caches
+        for key in cache.due_for_refresh(horizon, REFRESH_HOT_HITS)
+    ]
+    await asyncio.gather(*refreshes)
+
+def _refresh_semaphore(name: str) -> asyncio.Semaphore:
+    # Cache names and watchlist providers start with their upstream, e.g. roblox_status and
+    # roblox_universe share one limit, as do steam and steam_news.
+    upstream = name.split("_")[0]
+    semaphore = _refresh_semaphores.get(upstream)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY.get(upstream, 4))
+        _refresh_semaphores[upstream] = semaphore
+    return semaphore
+
+async def _refresh_key(cache: "TTLCache", key: str) -> None:
+    async with _refresh_semaphore(cache.name):
+        try:
+            await cache.refresh(key)
+        except Exception as e:
+            logging.warning(f"Scheduled refresh of {cache.name} cache failed - {str(e)}")
+
+async def _warm_watchlist() -> None:
+    """Warm every REFRESH_WATCHLIST item; runs as its own job so slow watched hosts never delay hot-key refreshes."""
+    await asyncio.gather(*(_warm_watched(item) for item in REFRESH_WATCHLIST))
+
+async def _warm_watched(item: str) -> None:
+    """Request a REFRESH_WATCHLIST item through its endpoint so its keys are cached and counted as hot."""
+    provider, _, target = item.partition(":")
+    async with _refresh_semaphore(provider):
+        await _request_watched(item, provider, target)
+
+async def _request_watched(item: str, provider: str, target: str) -> None:
+    try:
+        if provider == "minecraft":
+            host, _, port = target.partition(":")
+            await get_server_status(host, int(port) if port else None)
+        elif provider == "roblox":
+            await _get_roblox_game_status(target)
+        elif provider == "steam":
+            await get_steam_player_count(int(target))
+        elif provider == "steam_news":
+            await get_steam_news(int(target))
+        elif provider == "epic":
+            await get_epic_games(collection=target)
+        elif provider == "hytale":
+            host, _, rest = target.partition(":")
+            port, _, method = rest.partition(":")
+            await get_hytale_status(host, int(port) if port else None, method or HYTALE_METHOD_NITRADO)
+        else:
+            logging.warning(f"Unknown provider in REFRESH_WATCHLIST item {item}")
+    except Exception as e:
+        logging.warning(f"Failed to warm watched item {item} - {str(e)}")
+
+async def _roll_hot_keys() -> None:
+    # A coroutine so APScheduler runs it on the event loop; as a plain function it would run in a
+    # worker thread and race get_or_fetch over the hit counters.
+    for cache in _caches:
+        cache.roll_hot_keys(REFRESH_HOT_HITS)
+
+MINECRAFT_CACHE_TTL_SECONDS = int(os.environ.get("MINECRAFT_CACHE_TTL", 30))
+MINECRAFT_CACHE_STALE_SECONDS = int(os.environ.get("MINECRAFT_CACHE_STALE", 30))
+
+MINECRAFT_ENDPOINT_TTL_SECONDS = int(os.environ.get("MINECRAFT_ENDPOINT_TTL", 3600))
+MINECRAFT_ICON_TTL_SECONDS = int(os.environ.get("MINECRAFT_ICON_TTL", 86400))
+MINECRAFT_ICON_CACHE_BYTES = int(os.environ.get("MINECRAFT_ICON_CACHE_BYTES", 32 * 1024 * 1024))
+MINECRAFT_BATCH_CONCURRENCY = int(os.environ.get("MINECRAFT_BATCH_CONCURRENCY", 32))
+MINECRAFT_BATCH_MAX_SIZE = int(os.environ.get("MINECRAFT_BATCH_MAX_SIZE", 200))
+
+_minecraft_status_cache = TTLCache("minecraft_status", MINECRAFT_CACHE_TTL_SECONDS, MINECRAFT_CACHE_STALE_SECONDS)
+_minecraft_endpoint_cache = TTLCache("minecraft_endpoint", MINECRAFT_ENDPOINT_TTL_SECONDS)
+_minecraft_icon_store = TTLCache("minecraft_icon", MINECRAFT_ICON_TTL_SECONDS, max_bytes=MINECRAFT_ICON_CACHE_BYTES)
 
 CACHE_TTL_SECONDS = int(os.environ.get("ROBLOX_CACHE_TTL", 600))
 
+CACHE_STALE_SECONDS = int(os.environ.get("ROBLOX_CACHE_STALE", 300))
+
+ROBLOX_UNIVERSE_CACHE_TTL_SECONDS = int(os.environ.get("ROBLOX_UNIVERSE_CACHE_TTL", 86400))
+ROBLOX_GAMES_BATCH_WINDOW_MS = int(os.environ.get("ROBLOX_GAMES_BATCH_WINDOW_MS", 10))
+ROBLOX_GAMES_BATCH_SIZE = int(os.environ.get("ROBLOX_GAMES_BATCH_SIZE", 50))
+ROBLOX_BATCH_MAX_SIZE = int(os.environ.get("ROBLOX_BATCH_MAX_SIZE", 200))
+
+_roblox_status_cache = TTLCache("roblox_status", CACHE_TTL_SECONDS, CACHE_STALE_SECONDS)
+_roblox_universe_cache = TTLCache("roblox_universe", ROBLOX_UNIVERSE_CACHE_TTL_SECONDS, CACHE_STALE_SECONDS)
+
 STEAM_API_KEY = os.environ.get("STEAM_API_KEY")
 STEAM_CACHE_TTL_SECONDS = int(os.environ.get("STEAM_CACHE_TTL", 600))
+STEAM_CACHE_STALE_SECONDS = int(os.environ.get("STEAM_CACHE_STALE", 300))
 
-_steam_player_cache: Dict[str, Tuple[float, dict]] = {}
-_steam_news_cache: Dict[str, Tuple[float, dict]] = {}
+STEAM_NEWS_FETCH_COUNT = int(os.environ.get("STEAM_NEWS_FETCH_COUNT", 50))
+STEAM_NEWS_MAX_CONTENTS = int(os.environ.get("STEAM_NEWS_MAX_CONTENTS", 8000))
+STEAM_NEWS_CACHE_BYTES = int(os.environ.get("STEAM_NEWS_CACHE_BYTES", 64 * 1024 * 1024))
 
-_steam_player_lock = asyncio.Lock()
-_steam_news_lock = asyncio.Lock()
+_steam_player_cache = TTLCache("steam_player", STEAM_CACHE_TTL_SECONDS, STEAM_CACHE_STALE_SECONDS)
+_steam_news_cache = TTLCache(
+    "steam_news", STEAM_CACHE_TTL_SECONDS, STEAM_CACHE_STALE_SECONDS, max_bytes=STEAM_NEWS_CACHE_BYTES
+)
 
 EPIC_CACHE_TTL_SECONDS = int(os.environ.get("EPIC_CACHE_TTL", 600))
+EPIC_CACHE_STALE_SECONDS = int(os.environ.get("EPIC_CACHE_STALE", 300))
 
-_epic_games_cache: Dict[str, Tuple[float, dict]] = {}
-_epic_games_lock = asyncio.Lock()
+EPIC_GRAPHQL_URL = "https://store.epicgames.com/graphql"
+EPIC_LOCALE = "en-US"
+EPIC_COUNTRY = "US"
+EPIC_COLLECTIONS = ("most-played", "top-sellers", "most-popular", "top-player-reviewed", "top-wishlisted")
+
+_epic_games_cache = TTLCache("epic_games", EPIC_CACHE_TTL_SECONDS, EPIC_CACHE_STALE_SECONDS)
 
 HYTALE_CACHE_TTL_SECONDS = int(os.environ.get("HYTALE_CACHE_TTL", 60))
+HYTALE_CACHE_STALE_SECONDS = int(os.environ.get("HYTALE_CACHE_STALE", 30))
 HYTALE_DEFAULT_QUERY_PORT = 5523
 HYTALE_DEFAULT_GAME_PORT = 5520
-
-_hytale_status_cache: Dict[str, Tuple[float, dict]] = {}
-_hytale_status_lock = asyncio.Lock()
+HYTALE_METHOD_TTL_SECONDS = int(os.environ.get("HYTALE_METHOD_TTL", 3600))
+HYTALE_NITRADO_GRACE_MS = int(os.environ.get("HYTALE_NITRADO_GRACE_MS", 250))
+HYTALE_METHOD_NITRADO = "nitrado"
+HYTALE_METHOD_HYQUERY = "hyquery"
+HYTALE_METHOD_AUTO = "auto"
+HYTALE_BATCH_CONCURRENCY = int(os.environ.get("HYTALE_BATCH_CONCURRENCY", 64))
+HYTALE_BATCH_MAX_SIZE = int(os.environ.get("HYTALE_BATCH_MAX_SIZE", 500))
+HYQUERY_TIMEOUT_SECONDS = int(os.environ.get("HYQUERY_TIMEOUT", 5))
+HYQUERY_MAGIC = b"HYQUERY\0"
+
+_hytale_status_cache = TTLCache("hytale_status", HYTALE_CACHE_TTL_SECONDS, HYTALE_CACHE_STALE_SECONDS)
+_hytale_method_cache = TTLCache("hytale_method", HYTALE_METHOD_TTL_SECONDS)
+
+REFRESH_CONCURRENCY = {
+    "minecraft": int(os.environ.get("MINECRAFT_REFRESH_CONCURRENCY", 16)),
+    "roblox": int(os.environ.get("ROBLOX_REFRESH_CONCURRENCY", 4)),
+    "steam": int(os.environ.get("STEAM_REFRESH_CONCURRENCY", 4)),
+    "epic": int(os.environ.get("EPIC_REFRESH_CONCURRENCY", 1)),
+    "hytale": int(os.environ.get("HYTALE_REFRESH_CONCURRENCY", 16)),
+}
 
 class ServerStatusResponse(BaseModel):
     isOnline: bool
@@ -53,6 +769,27 @@ class ServerStatusResponse(BaseModel):
     description: Optional[str]
     checkedAt: datetime
     icon: Optional[str]
+    iconHash: Optional[str] = None
+    iconUrl: Optional[str] = None
+
+class ServerStatusBatchItem(BaseModel):
+    host: str
+    server_port: Optional[int] = None
+    edition: Literal["auto", "java", "bedrock"] = "auto"
+    include_icon: bool = False
+
+class ServerStatusBatchRequest(BaseModel):
+    servers: List[ServerStatusBatchItem] = Field(..., max_length=MINECRAFT_BATCH_MAX_SIZE)
+
+class ServerStatusBatchResult(BaseModel):
+    host: str
+    server_port: Optional[int] = None
+    status: Optional[ServerStatusResponse] = None
+    error: Optional[str] = None
+    elapsedMs: float
+
+class ServerStatusBatchResponse(BaseModel):
+    results: List[ServerStatusBatchResult] = []
 
 class RobloxStatusResponse(BaseModel):
     is_online: bool
@@ -62,6 +799,14 @@ class RobloxStatusResponse(BaseModel):
     description: Optional[str] = None
     place_id: Optional[str] = None
 
+class RobloxStatusBatchRequest(BaseModel):
+    place_ids: List[str] = Field([], max_length=ROBLOX_BATCH_MAX_SIZE)
+    universe_ids: List[str] = Field([], max_length=ROBLOX_BATCH_MAX_SIZE)
+
+class RobloxStatusBatchResponse(BaseModel):
+    places: Dict[str, RobloxStatusResponse] = {}
+    universes: Dict[str, RobloxStatusResponse] = {}
+
 class RobloxUniverseResponse(BaseModel):
     universe_id: Optional[str] = None
 
@@ -116,9 +861,54 @@ class HytaleServerStatusResponse(BaseModel):
     defaultWorld: Optional[str] = None
     players: List[HytalePlayerInfo] = []
     protocolVersion: Optional[int] = None
+    queryMethod: Optional[str] = None
     checkedAt: datetime
 
-app = FastAPI(title="Conduit Status Check API", version="1.0.0")
+class HytaleStatusBatchItem(BaseModel):
+    host: str
+    port: Optional[int] = None
+    method: str = "nitrado"
+
+class HytaleStatusBatchRequest(BaseModel):
+    servers: List[HytaleStatusBatchItem] = Field(..., max_length=HYTALE_BATCH_MAX_SIZE)
+
+class HytaleStatusBatchResult(BaseModel):
+    host: str
+    port: Optional[int] = None
+    method: str
+    status: Optional[HytaleServerStatusResponse] = None
+    error: Optional[str] = None
+    elapsedMs: float
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _http_session, _probe_http_session
+    _http_session = _create_http_session()
+    _probe_http_session = _create_http_session(HTTP_PROBE_POOL_LIMIT)
+    _load_cache_snapshot()
+    sweeper = asyncio.create_task(_sweep_caches())
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(_refresh_hot_keys, "interval", seconds=REFRESH_INTERVAL_SECONDS, max_instances=1, coalesce=True)
+    scheduler.add_job(_roll_hot_keys, "interval", seconds=REFRESH_HOT_WINDOW_SECONDS)
+    if REFRESH_WATCHLIST:
+        scheduler.add_job(_warm_watchlist, "interval", seconds=REFRESH_INTERVAL_SECONDS, max_instances=1, coalesce=True)
+    if CACHE_SNAPSHOT_INTERVAL_SECONDS > 0:
+        scheduler.add_job(_save_cache_snapshot, "interval", seconds=CACHE_SNAPSHOT_INTERVAL_SECONDS, max_instances=1)
+    scheduler.start()
+    try:
+        yield
+    finally:
+        scheduler.shutdown(wait=False)
+        sweeper.cancel()
+        await _save_cache_snapshot()
+        await _http_session.close()
+        await _probe_http_session.close()
+        _http_session = None
+        _probe_http_session = None
+        if _hyquery_protocol is not None and _hyquery_protocol.transport is not None:
+            _hyquery_protocol.transport.close()
+
+app = FastAPI(title="Conduit Status Check API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -128,58 +918,214 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-async def ping_minecraft_server(host: str, server_port: Optional[int]) -> dict:
-    try:
-        if server_port is None:
-            server = JavaServer.lookup(host)
-        else:
-            server = JavaServer.lookup(str(host + ":" + str(server_port)))
+_rendered_responses: "OrderedDict[str, Tuple[float, bytes, str]]" = OrderedDict()
+_rendered_bytes = 0
+
+def _cached_json_response(
+    request: Optional[Request],
+    key: str,
+    source: Any,
+    build: Callable[[], Any],
+    model: Any,
+    cache: "TTLCache",
+    cache_key: str,
+) -> Response:
+    """Return build() serialized through model as a raw JSON response, with a strong ETag of the body.
+
+    source is the value cache returned for cache_key. The encoded body is kept per key under that
+    entry's version and reused while the entry is unchanged, so cache hits skip response_model
+    validation and JSON encoding entirely. Only the version is kept, never source itself, so values
+    the cache evicts are freed. Cache-Control max-age is the entry's remaining TTL, and a request
+    whose If-None-Match matches the ETag gets an empty 304.
+    """
+    global _rendered_bytes
+    version = cache.version(cache_key, source)
+    rendered = _rendered_responses.get(key)
+    if rendered is not None and version is not None and rendered[0] == version:
+        _rendered_responses.move_to_end(key)
+    else:
+        body = model.model_validate(build()).model_dump_json().encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if rendered is not None:
+            del _rendered_responses[key]
+            _rendered_bytes -= len(rendered[1])
+        rendered = (version, body, etag)
+        if version is not None:
+            _rendered_responses[key] = rendered
+            _rendered_bytes += len(body)
+        while len(_rendered_responses) > RESPONSE_CACHE_MAX_ENTRIES or _rendered_bytes > RESPONSE_CACHE_MAX_BYTES:
+            _, evicted = _rendered_responses.popitem(last=False)
+            _rendered_bytes -= len(evicted[1])
+    headers = {"ETag": rendered[2], "Cache-Control": f"public, max-age={cache.remaining_ttl(cache_key)}"}
+    if request is not None and _etag_matches(request.headers.get("if-none-match"), rendered[2]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered[1], media_type="application/json", headers=headers)
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix added by a proxy still matches.
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+MINECRAFT_EDITION_JAVA = "java"
+MINECRAFT_EDITION_BEDROCK = "bedrock"
+MINECRAFT_EDITION_AUTO = "auto"
+
+async def ping_minecraft_java(host: str, server_port: Optional[int]) -> dict:
+    if server_port is None:
+        server = await JavaServer.async_lookup(host)
+    else:
+        server = await JavaServer.async_lookup(str(host + ":" + str(server_port)))
 
-        status = await asyncio.to_thread(server.status)
+    return await _query_minecraft_java(server)
 
-        return {
-            "is_online": True,
-            "player_count": status.players.online,
-            "max_players": status.players.max,
-            "latency": status.latency,
-            "version": status.version.name,
-            "motd": status.motd.to_plain(),
-            "icon": status.icon,
-        }
-    except Exception as e:
-        logging.warning(f"Failed to ping {host}:{server_port} as Java - {str(e)}")
-        try:
-            if server_port is None:
-                server = BedrockServer.lookup(host)
-            else:
-                server = BedrockServer.lookup(str(host + ":" + str(server_port)))
+async def ping_minecraft_bedrock(host: str, server_port: Optional[int]) -> dict:
+    if server_port is None:
+        server = BedrockServer.lookup(host)
+    else:
+        server = BedrockServer.lookup(str(host + ":" + str(server_port)))
 
-            status = await asyncio.to_thread(server.status)
+    ip = await server.address.async_resolve_ip()
+    return await _query_minecraft_bedrock(BedrockServer(str(ip), server.address.port))
 
-            return {
-                "is_online": True,
-                "player_count": status.players.online,
-                "max_players": status.players.max,
-                "latency": status.latency,
-                "version": status.version.name,
-                "motd": status.motd.to_plain(),
-                "icon": None,
-            }
+async def _query_minecraft_java(server: JavaServer) -> dict:
+    status = await server.async_status()
+
+    return {
+        "is_online": True,
+        "edition": MINECRAFT_EDITION_JAVA,
+        "endpoint": {"edition": MINECRAFT_EDITION_JAVA, "host": server.address.host, "port": server.address.port},
+        "player_count": status.players.online,
+        "max_players": status.players.max,
+        "latency": status.latency,
+        "version": status.version.name,
+        "motd": status.motd.to_plain(),
+        "icon": status.icon,
+    }
+
+async def _query_minecraft_bedrock(server: BedrockServer) -> dict:
+    status = await server.async_status()
+
+    return {
+        "is_online": True,
+        "edition": MINECRAFT_EDITION_BEDROCK,
+        "endpoint": {"edition": MINECRAFT_EDITION_BEDROCK, "host": server.address.host, "port": server.address.port},
+        "player_count": status.players.online,
+        "max_players": status.players.max,
+        "latency": status.latency,
+        "version": status.version.name,
+        "motd": status.motd.to_plain(),
+        "icon": None,
+    }
+
+async def _ping_minecraft_endpoint(endpoint: dict) -> dict:
+    """Ping a remembered endpoint directly, skipping edition probing and the SRV lookup.
+
+    Bedrock endpoints are remembered as a resolved IP. Java endpoints keep the SRV target hostname
+    because proxies route on the hostname sent in the handshake, so that name still gets an A lookup
+    on each ping.
+    """
+    if endpoint["edition"] == MINECRAFT_EDITION_JAVA:
+        return await _query_minecraft_java(JavaServer(endpoint["host"], endpoint["port"]))
+    return await _query_minecraft_bedrock(BedrockServer(endpoint["host"], endpoint["port"]))
+
+async def ping_minecraft_server(host: str, server_port: Optional[int], edition: str = MINECRAFT_EDITION_AUTO) -> dict:
+    """Ping host as the given edition, or in auto mode race the Java and Bedrock probes and keep the first answer.
+
+    The edition and address that answered are remembered per host, so later pings go straight to them until they fail.
+    """
+    key = f"host={host}|port={server_port}"
+    endpoint = _minecraft_endpoint_cache.get(key)
+    if endpoint is not None and edition in (MINECRAFT_EDITION_AUTO, endpoint["edition"]):
+        try:
+            status = await _ping_minecraft_endpoint(endpoint)
+            status.pop("endpoint")
+            return status
         except Exception as e:
-            logging.warning(f"Failed to ping as Bedrock {host}:{server_port} - {str(e)}")
-            return {
-                "is_online": False,
-                "player_count": None,
-                "max_players": None,
-                "latency": None,
-                "version": None,
-                "motd": None,
-                "icon": None,
-            }
+            logging.warning(f"Failed to ping remembered {endpoint['edition']} endpoint for {host}:{server_port} - {str(e)}")
+            _minecraft_endpoint_cache.delete(key)
 
-@app.get("/conduitapi/servers/status", response_model=ServerStatusResponse)
-async def get_server_status(host: str, server_port: Optional[int] = None):
-    status = await ping_minecraft_server(host, server_port)
+    probes = {
+        MINECRAFT_EDITION_JAVA: ping_minecraft_java,
+        MINECRAFT_EDITION_BEDROCK: ping_minecraft_bedrock,
+    }
+    if edition in probes:
+        probes = {edition: probes[edition]}
+
+    tasks = {asyncio.ensure_future(probe(host, server_port)): name for name, probe in probes.items()}
+    failure = FAILURE_OFFLINE
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Retrieve every exception first so a failure finishing alongside a success is never left unretrieved.
+            outcomes = [(task, task.exception()) for task in done]
+            for task, e in outcomes:
+                if e is None:
+                    status = task.result()
+                    _minecraft_endpoint_cache.set(key, status.pop("endpoint"))
+                    return status
+            for task, e in outcomes:
+                logging.warning(f"Failed to ping {host}:{server_port} as {tasks[task].capitalize()} - {str(e)}")
+                failure = _classify_failure(e)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return {
+        "is_online": False,
+        "failure": failure,
+        "player_count": None,
+        "max_players": None,
+        "latency": None,
+        "version": None,
+        "motd": None,
+        "icon": None,
+    }
+
+def _normalize_minecraft_address(host: str, server_port: Optional[int]) -> Tuple[str, Optional[int]]:
+    """Lower-case the host, drop a trailing dot and split an inline "host:port" so equivalent addresses share a cache key."""
+    host = host.strip().lower().rstrip(".")
+    if server_port is None and host.count(":") == 1:
+        name, _, port = host.partition(":")
+        if port.isdigit():
+            host, server_port = name.rstrip("."), int(port)
+    return host, server_port
+
+def _store_minecraft_icon(icon: str) -> Optional[str]:
+    """Decode a favicon data URI into the content-addressed icon store and return its hash."""
+    _, _, encoded = icon.partition("base64,")
+    try:
+        png = base64.b64decode(encoded, validate=True)
+    except ValueError as e:
+        logging.warning(f"Failed to decode Minecraft server icon - {str(e)}")
+        return None
+    icon_hash = hashlib.sha256(png).hexdigest()
+    _minecraft_icon_store.set(icon_hash, png)
+    return icon_hash
+
+async def _get_minecraft_status_entry(host: str, server_port: Optional[int], edition: str) -> dict:
+    host, server_port = _normalize_minecraft_address(host, server_port)
+    key = _minecraft_status_key(host, server_port, edition)
+
+    async def fetch() -> dict:
+        status = await ping_minecraft_server(host, server_port, edition)
+        status["checked_at"] = datetime.now(timezone.utc)
+        status["icon_hash"] = _store_minecraft_icon(status["icon"]) if status["icon"] else None
+        if not status["is_online"]:
+            # The failure class stays in the cached status so batch results can report it.
+            raise CachedFailure(status.setdefault("failure", FAILURE_OFFLINE), status)
+        return status
+
+    return await _minecraft_status_cache.get_or_fetch(key, fetch)
+
+def _minecraft_status_key(host: str, server_port: Optional[int], edition: str) -> str:
+    host, server_port = _normalize_minecraft_address(host, server_port)
+    return f"host={host}|port={server_port}|edition={edition}"
+
+def _minecraft_status_response(status: dict, include_icon: bool) -> ServerStatusResponse:
+    icon_hash = status["icon_hash"]
     return ServerStatusResponse(
         isOnline=status["is_online"],
         onlinePlayers=status["player_count"],
@@ -187,166 +1133,381 @@ async def get_server_status(host: str, server_port: Optional[int] = None):
         ping=status["latency"],
         version=status["version"],
         description=status["motd"],
-        checkedAt=datetime.now(timezone.utc),
-        icon=status["icon"],
+        checkedAt=status["checked_at"],
+        icon=status["icon"] if include_icon else None,
+        iconHash=icon_hash,
+        iconUrl=f"/conduitapi/servers/icon/{icon_hash}" if icon_hash else None,
     )
 
-@app.get("/conduitapi/roblox/status", response_model=RobloxStatusResponse)
-async def get_roblox_status(place_id: Optional[str] = None, universe_id: Optional[str] = None) -> dict:
-    key = f"place={place_id}|universe={universe_id}"
-    now = time.time()
-    cached = _roblox_status_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
-
-    async with _roblox_status_lock:
-        cached = _roblox_status_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+@app.get("/conduitapi/servers/status", response_model=ServerStatusResponse)
+async def get_server_status(
+    host: str,
+    server_port: Optional[int] = None,
+    edition: Literal["auto", "java", "bedrock"] = MINECRAFT_EDITION_AUTO,
+    include_icon: bool = False,
+    request: Request = None,
+):
+    status = await _get_minecraft_status_entry(host, server_port, edition)
+    return _cached_json_response(
+        request,
+        f"minecraft|{host}|{server_port}|{edition}|{include_icon}",
+        status,
+        lambda: _minecraft_status_response(status, include_icon),
+        ServerStatusResponse,
+        _minecraft_status_cache,
+        _minecraft_status_key(host, server_port, edition),
+    )
+
+@app.get("/conduitapi/servers/icon/{icon_hash}")
+async def get_server_icon(icon_hash: str):
+    png = _minecraft_icon_store.get(icon_hash)
+    if png is None:
+        return Response(status_code=404)
+    return Response(
+        content=png,
+        media_type="image/png",
+        headers={"Cache-Control": "public, max-age=31536000, immutable", "ETag": f'"{icon_hash}"'},
+    )
+
+@app.post("/conduitapi/servers/status/batch", response_model=ServerStatusBatchResponse)
+async def get_server_status_batch(request: ServerStatusBatchRequest):
+    """Check many Minecraft servers at once, at most MINECRAFT_BATCH_CONCURRENCY at a time, sharing the status cache."""
+    semaphore = asyncio.Semaphore(MINECRAFT_BATCH_CONCURRENCY)
+
+    async def check(item: ServerStatusBatchItem) -> ServerStatusBatchResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                entry = await _get_minecraft_status_entry(item.host, item.server_port, item.edition)
+                status = _minecraft_status_response(entry, item.include_icon)
+                error = None if entry["is_online"] else entry.get("failure", FAILURE_OFFLINE)
+            except Exception as e:
+                logging.warning(f"Failed to check {item.host}:{item.server_port} in batch - {str(e)}")
+                status, error = None, str(e) or type(e).__name__
+            return ServerStatusBatchResult(
+                host=item.host,
+                server_port=item.server_port,
+                status=status,
+                error=error,
+                elapsedMs=(time.perf_counter() - started) * 1000,
+            )
+
+    results = await asyncio.gather(*(check(item) for item in request.servers))
+    return ServerStatusBatchResponse(results=results)
+
+class RobloxGamesBatcher:
+    """Coalesces concurrent games API lookups into one multi-ID request.
 
+    Universe IDs requested within window seconds of each other (or until max_batch are queued)
+    are fetched together and each caller receives its own game entry, or None if Roblox returned none.
+    """
+
+    def __init__(self, window: float, max_batch: int):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, "asyncio.Future[Optional[dict]]"] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks, so running fetches are held here until done.
+        self._fetches: "set[asyncio.Task[None]]" = set()
+
+    async def get(self, universe_id: str) -> Optional[dict]:
+        future = self._pending.get(universe_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[universe_id] = future
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._fetch(batch))
+            self._fetches.add(task)
+            task.add_done_callback(self._fetches.discard)
+
+    async def _fetch(self, batch: Dict[str, "asyncio.Future[Optional[dict]]"]) -> None:
         try:
-            import aiohttp
-
-            if place_id and not universe_id:
-                first_url = f"https://apis.roblox.com/universes/v1/places/{place_id}/universe"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(first_url) as response:
-                        data = await response.json()
-                        universe_id = data.get("universeId", None)
-                if universe_id is None:
-                    result = {"is_online": False}
-                    _roblox_status_cache[key] = (time.time() + CACHE_TTL_SECONDS, result)
-                    return result
-
-            url = f"https://games.roblox.com/v1/games?universeIds={universe_id}"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-                    if "data" in data and len(data["data"]) > 0:
-                        game_data = data["data"][0]
-                        result = {
-                            "is_online": True,
-                            "playing": game_data.get("playing", 0),
-                            "max_players": game_data.get("maxPlayers", None),
-                            "name": game_data.get("name", None),
-                            "description": game_data.get("description", None),
-                            "place_id": str(game_data.get("rootPlaceId", None)),
-                        }
-                    else:
-                        result = {"is_online": False}
-
-            _roblox_status_cache[key] = (time.time() + CACHE_TTL_SECONDS, result)
-            return result
+            url = f"https://games.roblox.com/v1/games?universeIds={','.join(batch)}"
+            session = _get_http_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
+            games = {str(game.get("id")): game for game in data.get("data", [])}
         except Exception as e:
-            logging.warning(f"Failed to get Roblox status - {str(e)}")
-            result = {"is_online": False}
-            _roblox_status_cache[key] = (time.time() + CACHE_TTL_SECONDS, result)
-            return result
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
 
-@app.get("/conduitapi/roblox/universe", response_model=RobloxUniverseResponse)
-async def get_roblox_universe_id(place_id: int) -> dict:
-    key = str(place_id)
-    now = time.time()
-    cached = _roblox_universe_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
+        for universe_id, future in batch.items():
+            if not future.done():
+                future.set_result(games.get(universe_id))
 
-    async with _roblox_universe_lock:
-        cached = _roblox_universe_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+_roblox_games_batcher = RobloxGamesBatcher(ROBLOX_GAMES_BATCH_WINDOW_MS / 1000, ROBLOX_GAMES_BATCH_SIZE)
 
-        try:
-            import aiohttp
+async def _get_roblox_universe(place_id: str) -> dict:
+    """Resolve a place to its universe through the long-lived place -> universe cache."""
+    key = str(place_id).strip()
 
-            url = f"https://apis.roblox.com/universes/v1/places/{place_id}/universe"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    data = await response.json()
-                    result = { "universe_id": f'{data.get("universeId", None)}' }
+    async def fetch() -> dict:
+        if not key.isdigit():
+            raise CachedFailure(FAILURE_OFFLINE, {"universe_id": None})
+
+        try:
+            url = f"https://apis.roblox.com/universes/v1/places/{key}/universe"
+            session = _get_http_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
         except Exception as e:
             logging.warning(f"Failed to get Roblox universe ID - {str(e)}")
-            result = {"universe_id": None}
+            raise CachedFailure(_classify_failure(e), {"universe_id": None})
 
-        _roblox_universe_cache[key] = (time.time() + CACHE_TTL_SECONDS, result)
-        return result
+        if data.get("universeId") is None:
+            raise CachedFailure(FAILURE_OFFLINE, {"universe_id": None})
+        return { "universe_id": f'{data.get("universeId", None)}' }
 
-@app.get("/conduitapi/steam/player_count", response_model=SteamPlayerCountResponse)
-async def get_steam_player_count(appid: int) -> dict:
-    key = str(appid)
-    now = time.time()
-    cached = _steam_player_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
+    return await _roblox_universe_cache.get_or_fetch(key, fetch)
+
+async def _get_roblox_game_status(universe_id: str) -> dict:
+    key = str(universe_id).strip()
 
-    async with _steam_player_lock:
-        cached = _steam_player_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+    async def fetch() -> dict:
+        if not key.isdigit():
+            raise CachedFailure(FAILURE_OFFLINE, {"is_online": False})
 
         try:
-            import aiohttp
+            game_data = await _roblox_games_batcher.get(key)
+        except Exception as e:
+            logging.warning(f"Failed to get Roblox status - {str(e)}")
+            raise CachedFailure(_classify_failure(e), {"is_online": False})
+
+        if game_data is None:
+            raise CachedFailure(FAILURE_OFFLINE, {"is_online": False})
+
+        return {
+            "is_online": True,
+            "playing": game_data.get("playing", 0),
+            "max_players": game_data.get("maxPlayers", None),
+            "name": game_data.get("name", None),
+            "description": game_data.get("description", None),
+            "place_id": str(game_data.get("rootPlaceId", None)),
+        }
+
+    return await _roblox_status_cache.get_or_fetch(key, fetch)
+
+@app.get("/conduitapi/roblox/status", response_model=RobloxStatusResponse)
+async def get_roblox_status(
+    place_id: Optional[str] = None,
+    universe_id: Optional[str] = None,
+    request: Request = None,
+):
+    universe = None
+    if place_id and not universe_id:
+        universe = await _get_roblox_universe(place_id)
+        universe_id = universe["universe_id"]
+    if not universe_id:
+        # Nothing to look up: the answer lives as long as the place -> universe entry, if there is one.
+        return _cached_json_response(
+            request,
+            f"roblox_place|{place_id}",
+            universe,
+            lambda: {"is_online": False},
+            RobloxStatusResponse,
+            _roblox_universe_cache,
+            str(place_id or "").strip(),
+        )
+
+    status = await _get_roblox_game_status(universe_id)
+    return _cached_json_response(
+        request,
+        f"roblox|{universe_id}",
+        status,
+        lambda: status,
+        RobloxStatusResponse,
+        _roblox_status_cache,
+        str(universe_id).strip(),
+    )
+
+@app.post("/conduitapi/roblox/status/batch", response_model=RobloxStatusBatchResponse)
+async def get_roblox_status_batch(request: RobloxStatusBatchRequest) -> dict:
+    """Status for many places and universes at once.
+
+    Places are resolved first so that every universe lookup that misses the cache is in flight
+    at the same time, letting RobloxGamesBatcher fold them into as few multi-ID requests as possible.
+    """
+    place_ids = list(dict.fromkeys(request.place_ids))
+    resolved = await asyncio.gather(*(_get_roblox_universe(place_id) for place_id in place_ids))
+    place_universes = {place_id: r["universe_id"] for place_id, r in zip(place_ids, resolved)}
 
+    universe_ids = list(dict.fromkeys(request.universe_ids))
+    wanted = list(dict.fromkeys(universe_ids + [u for u in place_universes.values() if u is not None]))
+    statuses = dict(zip(wanted, await asyncio.gather(*(_get_roblox_game_status(u) for u in wanted))))
+
+    return {
+        "places": {
+            place_id: statuses[universe_id] if universe_id is not None else {"is_online": False}
+            for place_id, universe_id in place_universes.items()
+        },
+        "universes": {universe_id: statuses[universe_id] for universe_id in universe_ids},
+    }
+
+@app.get("/conduitapi/roblox/universe", response_model=RobloxUniverseResponse)
+async def get_roblox_universe_id(place_id: int, request: Request = None):
+    key = str(place_id)
+    universe = await _get_roblox_universe(key)
+    return _cached_json_response(
+        request,
+        f"roblox_universe|{key}",
+        universe,
+        lambda: universe,
+        RobloxUniverseResponse,
+        _roblox_universe_cache,
+        key,
+    )
+
+@app.get("/conduitapi/steam/player_count", response_model=SteamPlayerCountResponse)
+async def get_steam_player_count(appid: int, request: Request = None):
+    key = str(appid)
+
+    async def fetch() -> dict:
+        try:
             url = f"https://api.steampowered.com/ISteamUserStats/GetNumberOfCurrentPlayers/v1/?appid={appid}"
             if STEAM_API_KEY:
                 url += f"&key={STEAM_API_KEY}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    data = await response.json()
-                    player_count = data.get("response", {}).get("player_count", None)
-                    result = {"appid": appid, "player_count": player_count, "checkedAt": datetime.now(timezone.utc)}
+            session = _get_http_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
+                player_count = data.get("response", {}).get("player_count", None)
+                result = {"appid": appid, "player_count": player_count, "checkedAt": datetime.now(timezone.utc)}
         except Exception as e:
             logging.warning(f"Failed to get Steam player count - {str(e)}")
             result = {"appid": appid, "player_count": None, "checkedAt": datetime.now(timezone.utc)}
+            raise CachedFailure(_classify_failure(e), result)
 
-        _steam_player_cache[key] = (time.time() + STEAM_CACHE_TTL_SECONDS, result)
+        if player_count is None:
+            raise CachedFailure(FAILURE_OFFLINE, result)
         return result
 
+    result = await _steam_player_cache.get_or_fetch(key, fetch)
+    return _cached_json_response(
+        request,
+        f"steam_player|{key}",
+        result,
+        lambda: result,
+        SteamPlayerCountResponse,
+        _steam_player_cache,
+        key,
+    )
+
 @app.get("/conduitapi/steam/news", response_model=SteamNewsResponse)
-async def get_steam_news(appid: int, count: int = 10, maxlength: int = 300) -> dict:
-    key = f"{appid}|count={count}|maxlength={maxlength}"
-    now = time.time()
-    cached = _steam_news_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
-
-    async with _steam_news_lock:
-        cached = _steam_news_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+async def get_steam_news(appid: int, count: int = 10, maxlength: int = 300, request: Request = None):
+    """
+    Fetch the latest news for a Steam app.
 
-        try:
-            import aiohttp
+    One superset (STEAM_NEWS_FETCH_COUNT items, contents cut to STEAM_NEWS_MAX_CONTENTS) is cached
+    per app and every count/maxlength combination is sliced and truncated from it locally.
+    """
+    key = str(appid)
 
-            url = f"https://api.steampowered.com/ISteamNews/GetNewsForApp/v2/?appid={appid}&count={count}&maxlength={maxlength}"
+    async def fetch() -> dict:
+        try:
+            url = f"https://api.steampowered.com/ISteamNews/GetNewsForApp/v2/?appid={appid}&count={STEAM_NEWS_FETCH_COUNT}&maxlength=0"
             if STEAM_API_KEY:
                 url += f"&key={STEAM_API_KEY}"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    data = await response.json()
-                    items = data.get("appnews", {}).get("newsitems", [])
-                    news_list = []
-                    for it in items:
-                        news_item = {
-                            "gid": str(it.get("gid", "")),
-                            "title": it.get("title", None),
-                            "url": it.get("url", None),
-                            "author": it.get("author", None),
-                            "contents": it.get("contents", None),
-                            "date": it.get("date", None),
-                        }
-                        news_list.append(news_item)
-                    result = {"appid": appid, "news": news_list, "checkedAt": datetime.now(timezone.utc)}
+            session = _get_http_session()
+            async with session.get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
+                items = data.get("appnews", {}).get("newsitems", [])
+                news_list = []
+                for it in items:
+                    news_item = {
+                        "gid": str(it.get("gid", "")),
+                        "title": it.get("title", None),
+                        "url": it.get("url", None),
+                        "author": it.get("author", None),
+                        "contents": _truncate_news_contents(it.get("contents", None), STEAM_NEWS_MAX_CONTENTS),
+                        "date": it.get("date", None),
+                    }
+                    news_list.append(news_item)
+                result = {"appid": appid, "news": news_list, "checkedAt": datetime.now(timezone.utc)}
         except Exception as e:
             logging.warning(f"Failed to get Steam news - {str(e)}")
             result = {"appid": appid, "news": [], "checkedAt": datetime.now(timezone.utc)}
+            raise CachedFailure(_classify_failure(e), result)
 
-        _steam_news_cache[key] = (time.time() + STEAM_CACHE_TTL_SECONDS, result)
         return result
 
+    superset = await _steam_news_cache.get_or_fetch(key, fetch)
+
+    def build() -> dict:
+        news = [
+            {**item, "contents": _truncate_news_contents(item["contents"], maxlength)}
+            for item in superset["news"][:max(count, 0)]
+        ]
+        return {"appid": appid, "news": news, "checkedAt": superset["checkedAt"]}
+
+    return _cached_json_response(
+        request,
+        f"steam_news|{key}|{count}|{maxlength}",
+        superset,
+        build,
+        SteamNewsResponse,
+        _steam_news_cache,
+        key,
+    )
+
+def _truncate_news_contents(contents: Optional[str], maxlength: int) -> Optional[str]:
+    """Mimic Steam's maxlength: 0 keeps the full contents, otherwise cut to maxlength and mark with an ellipsis."""
+    if contents is None or maxlength <= 0 or len(contents) <= maxlength:
+        return contents
+    return contents[:maxlength].rstrip() + "..."
+
+_epic_api = None
+
+async def _fetch_epic_collection(slug: str) -> dict:
+    """Run the Epic Store collection GraphQL query on the shared aiohttp session.
+
+    Uses the query shipped with epicstore_api so the requested fields stay in sync with it. If the store
+    answers with a Cloudflare challenge (403), falls back to the library's cloudscraper client in a thread.
+    """
+    from epicstore_api.queries import COLLECTION_QUERY
+
+    payload = {
+        "query": COLLECTION_QUERY,
+        "variables": {"slug": slug, "locale": EPIC_LOCALE, "country": EPIC_COUNTRY},
+    }
+    session = _get_http_session()
+    async with session.post(EPIC_GRAPHQL_URL, json=payload, headers={"Accept-Encoding": "gzip"}) as response:
+        if response.status != 403:
+            response.raise_for_status()
+            return await response.json()
+
+    logging.warning(f"Epic GraphQL request for {slug} was challenged, retrying with the cloudscraper client")
+    from epicstore_api.models import EGSCollectionType
+
+    return await asyncio.to_thread(_get_epic_api().get_collection, EGSCollectionType(slug))
+
+def _get_epic_api():
+    """Return the shared Epic Games Store client, creating it on first use."""
+    global _epic_api
+    if _epic_api is None:
+        from epicstore_api import EpicGamesStoreAPI
+
+        _epic_api = EpicGamesStoreAPI(locale=EPIC_LOCALE, country=EPIC_COUNTRY)
+    return _epic_api
+
 def _transform_epic_game(game: dict) -> dict:
     """Transform Epic Games API response to our model format."""
     game_id = game.get("id", "")
@@ -392,8 +1553,9 @@ def _transform_epic_game(game: dict) -> dict:
 async def get_epic_games(
     count: int = 10,
     collection: str = "most-played",
-    free_only: bool = False
-) -> dict:
+    free_only: bool = False,
+    request: Request = None,
+):
     """
     Fetch Epic Games from curated collections.
 
@@ -402,34 +1564,12 @@ async def get_epic_games(
         collection: Collection type - "most-played", "top-sellers", "most-popular", "top-player-reviewed"
         free_only: If true, only return free games from the collection
     """
-    key = f"collection={collection}|count={count}|free_only={free_only}"
-    now = time.time()
-    cached = _epic_games_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
-
-    async with _epic_games_lock:
-        cached = _epic_games_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+    if collection not in EPIC_COLLECTIONS:
+        collection = "most-played"
 
+    async def fetch() -> dict:
         try:
-            from epicstore_api import EpicGamesStoreAPI
-            from epicstore_api.models import EGSCollectionType
-
-            api = EpicGamesStoreAPI(locale="en-US", country="US")
-
-            # Map string to collection type
-            collection_map = {
-                "most-played": EGSCollectionType.MOST_PLAYED,
-                "top-sellers": EGSCollectionType.TOP_SELLERS,
-                "most-popular": EGSCollectionType.MOST_POPULAR,
-                "top-player-reviewed": EGSCollectionType.TOP_PLAYER_RATED,
-                "top-wishlisted": EGSCollectionType.TOP_UPCOMING_WISHLISTED,
-            }
-
-            collection_type = collection_map.get(collection, EGSCollectionType.MOST_PLAYED)
-            raw = await asyncio.to_thread(api.get_collection, collection_type)
+            raw = await _fetch_epic_collection(collection)
 
             # Collection responses use Storefront.collectionLayout.collectionOffers
             elements = (
@@ -439,97 +1579,160 @@ async def get_epic_games(
                 .get("collectionOffers", [])
             )
 
-            if free_only:
-                # Filter to only free games (discountPrice == 0)
-                games_raw = [
-                    g for g in elements
-                    if g.get("price", {}).get("totalPrice", {}).get("discountPrice") == 0
-                ]
-            else:
-                games_raw = elements
-
-            games = [_transform_epic_game(g) for g in games_raw[:count]]
+            games = [_transform_epic_game(g) for g in elements]
             result = {"games": games, "checkedAt": datetime.now(timezone.utc)}
         except Exception as e:
             logging.warning(f"Failed to get Epic games - {str(e)}")
             result = {"games": [], "checkedAt": datetime.now(timezone.utc)}
+            raise CachedFailure(_classify_failure(e), result)
 
-        _epic_games_cache[key] = (time.time() + EPIC_CACHE_TTL_SECONDS, result)
         return result
 
+    cached = await _epic_games_cache.get_or_fetch(collection, fetch)
+
+    def build() -> dict:
+        games = cached["games"]
+        if free_only:
+            games = [g for g in games if g["is_free"]]
+        return {"games": games[:max(count, 0)], "checkedAt": cached["checkedAt"]}
+
+    return _cached_json_response(
+        request,
+        f"epic|{collection}|{count}|{free_only}",
+        cached,
+        build,
+        EpicGamesResponse,
+        _epic_games_cache,
+        collection,
+    )
+
 async def ping_hytale_nitrado(host: str, port: int) -> dict:
     try:
-        import aiohttp
-
         url = f"http://{host}:{port}/Nitrado/Query"
         headers = {
             "Accept": "application/x.hytale.nitrado.query+json;version=1"
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    logging.warning(f"Hytale Nitrado query failed with status {response.status}")
-                    return {"is_online": False}
+        session = _get_probe_http_session()
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                logging.warning(f"Hytale Nitrado query failed with status {response.status}")
+                failure = FAILURE_UPSTREAM if response.status >= 500 else FAILURE_OFFLINE
+                return {"is_online": False, "failure": failure}
 
-                data = await response.json()
+            data = await response.json()
 
-                server_info = data.get("Server", {})
-                universe_info = data.get("Universe", {})
-                players_list = data.get("Players", [])
-
-                players = []
-                for player in players_list:
-                    players.append({
-                        "name": player.get("Name", "Unknown"),
-                        "uuid": player.get("UUID"),
-                        "world": player.get("World"),
-                    })
-
-                return {
-                    "is_online": True,
-                    "server_name": server_info.get("Name"),
-                    "version": server_info.get("Version"),
-                    "online_players": universe_info.get("CurrentPlayers"),
-                    "max_players": server_info.get("MaxPlayers"),
-                    "default_world": universe_info.get("DefaultWorld"),
-                    "players": players,
-                    "protocol_version": server_info.get("ProtocolVersion"),
-                }
+            server_info = data.get("Server", {})
+            universe_info = data.get("Universe", {})
+            players_list = data.get("Players", [])
+
+            players = []
+            for player in players_list:
+                players.append({
+                    "name": player.get("Name", "Unknown"),
+                    "uuid": player.get("UUID"),
+                    "world": player.get("World"),
+                })
+
+            return {
+                "is_online": True,
+                "server_name": server_info.get("Name"),
+                "version": server_info.get("Version"),
+                "online_players": universe_info.get("CurrentPlayers"),
+                "max_players": server_info.get("MaxPlayers"),
+                "default_world": universe_info.get("DefaultWorld"),
+                "players": players,
+                "protocol_version": server_info.get("ProtocolVersion"),
+            }
     except asyncio.TimeoutError:
         logging.warning(f"Hytale Nitrado query timed out for {host}:{port}")
-        return {"is_online": False}
+        return {"is_online": False, "failure": FAILURE_TIMEOUT}
     except Exception as e:
         logging.warning(f"Failed to ping Hytale server {host}:{port} via Nitrado - {str(e)}")
-        return {"is_online": False}
+        return {"is_online": False, "failure": _classify_failure(e)}
 
-async def ping_hytale_hyquery(host: str, port: int) -> dict:
-    try:
-        import socket
-        import struct
+class HyQueryProtocol(asyncio.DatagramProtocol):
+    """One UDP socket shared by every HyQuery probe.
 
-        magic_bytes = b"HYQUERY\0"
+    Replies are matched to waiters by source address, and each waiter's deadline is a loop timer,
+    so any number of queries can be in flight without a thread or socket per query.
+    """
 
-        def do_udp_query():
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(5)
-            try:
-                sock.sendto(magic_bytes, (host, port))
-                data, _ = sock.recvfrom(4096)
-                return data
-            finally:
-                sock.close()
+    def __init__(self):
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self._waiters: Dict[Tuple[str, int], List["asyncio.Future[bytes]"]] = {}
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        for future in self._waiters.pop(addr[:2], []):
+            if not future.done():
+                future.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        logging.debug(f"HyQuery socket error - {str(exc)}")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        waiters, self._waiters = self._waiters, {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(ConnectionError("HyQuery socket closed"))
+
+    async def query(self, ip: str, port: int, timeout: float) -> bytes:
+        """Send a probe to ip:port (unless one is already waiting on a reply from it) and await the reply."""
+        loop = asyncio.get_running_loop()
+        addr = (ip, port)
+        future = loop.create_future()
+        waiters = self._waiters.setdefault(addr, [])
+        waiters.append(future)
+        if len(waiters) == 1:
+            self.transport.sendto(HYQUERY_MAGIC, addr)
+        deadline = loop.call_later(timeout, self._expire, future)
+        try:
+            return await future
+        finally:
+            deadline.cancel()
+            waiters = self._waiters.get(addr)
+            if waiters and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[addr]
+
+    @staticmethod
+    def _expire(future: "asyncio.Future[bytes]") -> None:
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+
+_hyquery_protocol: Optional[HyQueryProtocol] = None
+_hyquery_lock = asyncio.Lock()
+
+async def _get_hyquery_protocol() -> HyQueryProtocol:
+    """Return the shared HyQuery endpoint, opening its socket on first use; the lifespan closes it on shutdown."""
+    global _hyquery_protocol
+    async with _hyquery_lock:
+        if _hyquery_protocol is None or _hyquery_protocol.transport is None or _hyquery_protocol.transport.is_closing():
+            loop = asyncio.get_running_loop()
+            _, _hyquery_protocol = await loop.create_datagram_endpoint(HyQueryProtocol, local_addr=("0.0.0.0", 0))
+    return _hyquery_protocol
 
-        response_data = await asyncio.to_thread(do_udp_query)
+async def ping_hytale_hyquery(host: str, port: int) -> dict:
+    try:
+        loop = asyncio.get_running_loop()
+        addresses = await loop.getaddrinfo(host, port, family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        ip = addresses[0][4][0]
+
+        protocol = await _get_hyquery_protocol()
+        response_data = await protocol.query(ip, port, HYQUERY_TIMEOUT_SECONDS)
 
         if not response_data or len(response_data) < 8:
-            return {"is_online": False}
+            return {"is_online": False, "failure": FAILURE_PARSE}
 
-        if not response_data.startswith(magic_bytes):
-            return {"is_online": False}
+        if not response_data.startswith(HYQUERY_MAGIC):
+            return {"is_online": False, "failure": FAILURE_PARSE}
 
         try:
-            import json
             json_data = response_data[8:].decode('utf-8')
             data = json.loads(json_data)
 
@@ -545,41 +1748,99 @@ async def ping_hytale_hyquery(host: str, port: int) -> dict:
             }
         except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logging.warning(f"Failed to parse HyQuery response: {e}")
-            return {"is_online": False}
+            return {"is_online": False, "failure": FAILURE_PARSE}
 
-    except socket.timeout:
+    except asyncio.TimeoutError:
         logging.warning(f"HyQuery timed out for {host}:{port}")
-        return {"is_online": False}
+        return {"is_online": False, "failure": FAILURE_TIMEOUT}
     except Exception as e:
         logging.warning(f"Failed to ping Hytale server {host}:{port} via HyQuery - {str(e)}")
-        return {"is_online": False}
+        return {"is_online": False, "failure": _classify_failure(e)}
+
+async def ping_hytale(host: str, port: Optional[int], method: str) -> dict:
+    """Query host with one method, using that method's default port when none is given."""
+    if method == HYTALE_METHOD_HYQUERY:
+        status = await ping_hytale_hyquery(host, port if port is not None else HYTALE_DEFAULT_GAME_PORT)
+    else:
+        status = await ping_hytale_nitrado(host, port if port is not None else HYTALE_DEFAULT_QUERY_PORT)
+    status["method"] = method
+    return status
+
+async def ping_hytale_auto(host: str, port: Optional[int]) -> dict:
+    """Race Nitrado and HyQuery and return the first valid answer.
+
+    A HyQuery answer waits up to HYTALE_NITRADO_GRACE_MS for the richer Nitrado payload. The method
+    that answered is remembered per host and tried alone next time, until it stops answering.
+    """
+    key = f"host={host}|port={port}"
+    remembered = _hytale_method_cache.get(key)
+    if remembered is not None:
+        status = await ping_hytale(host, port, remembered["method"])
+        if status.get("is_online"):
+            return status
+        _hytale_method_cache.delete(key)
+
+    nitrado = asyncio.ensure_future(ping_hytale(host, port, HYTALE_METHOD_NITRADO))
+    hyquery = asyncio.ensure_future(ping_hytale(host, port, HYTALE_METHOD_HYQUERY))
+    try:
+        pending = {nitrado, hyquery}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if nitrado in done and nitrado.result().get("is_online"):
+                status = nitrado.result()
+                break
+            if hyquery in done and hyquery.result().get("is_online"):
+                if not nitrado.done():
+                    await asyncio.wait({nitrado}, timeout=HYTALE_NITRADO_GRACE_MS / 1000)
+                if nitrado.done() and nitrado.result().get("is_online"):
+                    status = nitrado.result()
+                else:
+                    status = hyquery.result()
+                break
+        else:
+            status = nitrado.result()
+    finally:
+        nitrado.cancel()
+        hyquery.cancel()
+
+    if status.get("is_online"):
+        _hytale_method_cache.set(key, {"method": status["method"]})
+    return status
 
 @app.get("/conduitapi/hytale/status", response_model=HytaleServerStatusResponse)
 async def get_hytale_status(
     host: str,
     port: Optional[int] = None,
-    method: str = "nitrado"
-) -> dict:
-    if method == "hyquery":
-        effective_port = port if port is not None else HYTALE_DEFAULT_GAME_PORT
-    else:
-        effective_port = port if port is not None else HYTALE_DEFAULT_QUERY_PORT
+    method: str = "nitrado",
+    request: Request = None,
+):
+    status = await _get_hytale_status(host, port, method)
+    return _cached_json_response(
+        request,
+        f"hytale|{host}|{port}|{method}",
+        status,
+        lambda: status,
+        HytaleServerStatusResponse,
+        _hytale_status_cache,
+        _hytale_status_key(host, port, method),
+    )
+
+def _hytale_status_key(host: str, port: Optional[int], method: str) -> str:
+    if method not in (HYTALE_METHOD_AUTO, HYTALE_METHOD_HYQUERY):
+        method = HYTALE_METHOD_NITRADO
+    return f"host={host}|port={port}|method={method}"
 
-    key = f"host={host}|port={effective_port}|method={method}"
-    now = time.time()
-    cached = _hytale_status_cache.get(key)
-    if cached and cached[0] > now:
-        return cached[1]
+async def _get_hytale_status(host: str, port: Optional[int], method: str) -> dict:
+    if method not in (HYTALE_METHOD_AUTO, HYTALE_METHOD_HYQUERY):
+        method = HYTALE_METHOD_NITRADO
 
-    async with _hytale_status_lock:
-        cached = _hytale_status_cache.get(key)
-        if cached and cached[0] > now:
-            return cached[1]
+    key = _hytale_status_key(host, port, method)
 
-        if method == "hyquery":
-            status = await ping_hytale_hyquery(host, effective_port)
+    async def fetch() -> dict:
+        if method == HYTALE_METHOD_AUTO:
+            status = await ping_hytale_auto(host, port)
         else:
-            status = await ping_hytale_nitrado(host, effective_port)
+            status = await ping_hytale(host, port, method)
 
         players = [
             HytalePlayerInfo(
@@ -599,12 +1860,54 @@ async def get_hytale_status(
             "defaultWorld": status.get("default_world"),
             "players": players,
             "protocolVersion": status.get("protocol_version"),
+            "queryMethod": status.get("method") if status.get("is_online") else None,
             "checkedAt": datetime.now(timezone.utc),
         }
 
-        _hytale_status_cache[key] = (time.time() + HYTALE_CACHE_TTL_SECONDS, result)
+        if not result["isOnline"]:
+            raise CachedFailure(status.get("failure", FAILURE_OFFLINE), result)
         return result
 
+    return await _hytale_status_cache.get_or_fetch(key, fetch)
+
+@app.post("/conduitapi/hytale/status/batch")
+async def get_hytale_status_batch(request: HytaleStatusBatchRequest):
+    """Check many Hytale servers, at most HYTALE_BATCH_CONCURRENCY at a time, sharing the status cache.
+
+    Results are streamed as newline-delimited JSON in completion order, one HytaleStatusBatchResult per line.
+    """
+    semaphore = asyncio.Semaphore(HYTALE_BATCH_CONCURRENCY)
+
+    async def check(item: HytaleStatusBatchItem) -> HytaleStatusBatchResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                status = await _get_hytale_status(item.host, item.port, item.method)
+                error = None
+            except Exception as e:
+                logging.warning(f"Failed to check Hytale server {item.host}:{item.port} in batch - {str(e)}")
+                status, error = None, str(e) or type(e).__name__
+            return HytaleStatusBatchResult(
+                host=item.host,
+                port=item.port,
+                method=item.method,
+                status=status,
+                error=error,
+                elapsedMs=(time.perf_counter() - started) * 1000,
+            )
+
+    async def stream():
+        tasks = [asyncio.ensure_future(check(item)) for item in request.servers]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                yield result.model_dump_json() + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 7000))
@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 7000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Workers share one cache file so a single upstream fetch serves all of them. The cache holds pickles,
+# so by default it goes in a fresh directory only this user can access (mkdtemp creates it with 0700).
+if not os.environ.get("SHARED_CACHE_PATH"):
+    os.environ["SHARED_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="conduit-cache-"), "cache.sqlite3")
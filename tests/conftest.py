@@ -0,0 +1,10 @@
+import pytest
+
+import StatusCheckService as service
+
+
+@pytest.fixture(autouse=True)
+def no_shared_store(monkeypatch):
+    monkeypatch.setattr(service, "SHARED_CACHE_PATH", "")
+    monkeypatch.setattr(service, "_shared_store", None)
+    monkeypatch.setattr(service, "_shared_store_pid", None)
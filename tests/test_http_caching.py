@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import StatusCheckService as service
+
+URL = "/conduitapi/steam/player_count?appid={appid}"
+
+
+@pytest.fixture
+def client():
+    return TestClient(service.app)
+
+
+def seed_player_count(appid: int, player_count: int) -> None:
+    # Stands in for the Steam API: the route only reads through the cache.
+    service._steam_player_cache.set(
+        str(appid), {"appid": appid, "player_count": player_count, "checkedAt": datetime.now(timezone.utc)}
+    )
+
+
+def test_response_carries_etag_and_max_age_from_the_cache_entry(client):
+    seed_player_count(1001, 5)
+    response = client.get(URL.format(appid=1001))
+
+    assert response.status_code == 200
+    assert response.json()["player_count"] == 5
+    assert response.headers["etag"].startswith('"')
+    max_age = int(response.headers["cache-control"].split("max-age=")[1])
+    assert 0 < max_age <= service.STEAM_CACHE_TTL_SECONDS
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", '"other", {etag}', "*"])
+def test_matching_if_none_match_gets_an_empty_304(client, if_none_match):
+    seed_player_count(1002, 5)
+    etag = client.get(URL.format(appid=1002)).headers["etag"]
+
+    response = client.get(URL.format(appid=1002), headers={"If-None-Match": if_none_match.format(etag=etag)})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_changed_entry_gets_a_new_etag(client):
+    seed_player_count(1003, 5)
+    etag = client.get(URL.format(appid=1003)).headers["etag"]
+    seed_player_count(1003, 6)
+
+    response = client.get(URL.format(appid=1003), headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["player_count"] == 6
+    assert response.headers["etag"] != etag
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+import StatusCheckService as service
+from StatusCheckService import TTLCache
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    tmp_path.chmod(0o700)
+    monkeypatch.setattr(service, "SHARED_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    return service._get_shared_store()
+
+
+def make_cache() -> TTLCache:
+    cache = TTLCache("test", 60)
+    service._caches.remove(cache)
+    return cache
+
+
+def test_waiter_returns_peer_entry_without_waiting_for_the_lease(store):
+    cache = make_cache()
+    assert store.acquire_lease("test", "k", service.SHARED_CACHE_LEASE_SECONDS)
+
+    async def fetch():
+        raise AssertionError("a waiter must not fetch while a peer holds the lease")
+
+    async def peer():
+        # The peer stores its result but its lease release is lost.
+        await asyncio.sleep(0.1)
+        store.set("test", "k", time.time() + 60, 0, {"v": "peer"}, cache.max_entries, cache.max_bytes)
+
+    async def run():
+        started = time.perf_counter()
+        result, _ = await asyncio.gather(cache.get_or_fetch("k", fetch), peer())
+        return result, time.perf_counter() - started
+
+    result, elapsed = asyncio.run(run())
+    assert result == {"v": "peer"}
+    assert elapsed < 1
+
+
+def test_waiter_fetches_itself_when_the_lease_ends_without_an_entry(store):
+    cache = make_cache()
+    assert store.acquire_lease("test", "k", service.SHARED_CACHE_LEASE_SECONDS)
+
+    async def fetch():
+        return {"v": "own"}
+
+    async def peer():
+        await asyncio.sleep(0.1)
+        store.release_lease("test", "k")
+
+    async def run():
+        result, _ = await asyncio.gather(cache.get_or_fetch("k", fetch), peer())
+        return result
+
+    assert asyncio.run(run()) == {"v": "own"}
+    assert store.get("test", "k")[2] == {"v": "own"}
+    assert not store.lease_active("test", "k")
+
+
+def test_lease_is_exclusive_until_released(store):
+    assert store.acquire_lease("test", "k", 15)
+    assert not store.acquire_lease("test", "k", 15)
+    assert store.release_lease("test", "k")
+    assert store.acquire_lease("test", "k", 15)
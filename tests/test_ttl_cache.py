@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+import StatusCheckService as service
+from StatusCheckService import CachedFailure, TTLCache
+
+
+def make_cache(**kwargs) -> TTLCache:
+    cache = TTLCache("test", kwargs.pop("ttl", 60), **kwargs)
+    service._caches.remove(cache)
+    return cache
+
+
+def test_evicts_least_recently_used_beyond_max_entries():
+    cache = make_cache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+    assert len(cache) == 2
+
+
+def test_evicts_beyond_max_bytes_and_skips_oversized_values():
+    value = {"v": "x" * 100}
+    size = service._estimate_size("a", value)
+    cache = make_cache(max_bytes=size * 2)
+    for key in ("a", "b", "c"):
+        cache.set(key, value)
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+    assert cache._bytes <= cache.max_bytes
+
+    cache.set("big", {"v": "x" * 1000})
+    assert cache.get("big") is None
+    assert len(cache) == 2
+
+
+def test_serves_stale_value_while_refreshing_in_background():
+    cache = make_cache(stale_ttl=30)
+    cache.set("k", {"v": "old"}, ttl=-1)
+
+    async def fetch():
+        return {"v": "new"}
+
+    async def run():
+        assert await cache.get_or_fetch("k", fetch) == {"v": "old"}
+        await cache._inflight["k"]
+        return await cache.get_or_fetch("k", fetch)
+
+    assert asyncio.run(run()) == {"v": "new"}
+
+
+def test_failed_refresh_keeps_serving_stale_value():
+    cache = make_cache(stale_ttl=30)
+    cache.set("k", {"v": "good"}, ttl=-1)
+
+    async def fetch():
+        raise CachedFailure(service.FAILURE_TIMEOUT, {"v": "offline"})
+
+    async def run():
+        await cache.get_or_fetch("k", fetch)
+        await cache._inflight["k"]
+        return await cache.get_or_fetch("k", fetch)
+
+    assert asyncio.run(run()) == {"v": "good"}
+    assert "k" not in cache._inflight
+
+
+def test_entry_past_stale_window_is_fetched_again():
+    cache = make_cache(stale_ttl=30)
+    cache.set("k", {"v": "old"}, ttl=-31)
+
+    async def fetch():
+        return {"v": "new"}
+
+    assert asyncio.run(cache.get_or_fetch("k", fetch)) == {"v": "new"}
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache = make_cache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"v": calls}
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert results == [{"v": 1}] * 10
+
+
+def test_consecutive_failures_back_off_up_to_the_cap():
+    cache = make_cache(ttl=30)
+    ttls = []
+    for _ in range(6):
+        cache.set_failure("k", CachedFailure(service.FAILURE_OFFLINE, {}))
+        ttls.append(cache._entries["k"].expires_at - service.time.time())
+
+    assert ttls[0] == pytest.approx(cache.ttl, abs=1)
+    assert ttls[1] == pytest.approx(cache.ttl * 2, abs=1)
+    assert max(ttls) == pytest.approx(service.NEGATIVE_CACHE_MAX_TTL_SECONDS, abs=1)
+
+
+def test_roll_keeps_only_keys_hit_often_enough():
+    cache = make_cache()
+
+    async def fetch():
+        return {"v": 1}
+
+    async def run():
+        for _ in range(3):
+            await cache.get_or_fetch("hot", fetch)
+        await cache.get_or_fetch("cold", fetch)
+
+    asyncio.run(run())
+    cache.roll_hot_keys(3)
+
+    assert cache._hot == {"hot"}
+    assert set(cache._fetchers) == {"hot"}
+    assert cache._hits == {}
+
+
+def test_hot_key_is_refreshed_before_it_expires():
+    cache = make_cache(ttl=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"v": calls}
+
+    async def run():
+        for _ in range(3):
+            await cache.get_or_fetch("k", fetch)
+        cache.roll_hot_keys(3)
+        assert cache.due_for_refresh(service.time.time(), 3) == []
+        due = cache.due_for_refresh(service.time.time() + 60, 3)
+        assert due == ["k"]
+        await cache.refresh("k")
+
+    asyncio.run(run())
+    assert calls == 2
+    assert cache.get("k") == {"v": 2}
+
+
+def test_roll_hot_keys_runs_on_the_event_loop():
+    assert asyncio.iscoroutinefunction(service._roll_hot_keys)